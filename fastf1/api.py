@@ -117,6 +117,7 @@ class Cache:
     _requests_session = None
     _has_been_warned = False  # flag to ensure that warning about disabled cache is logged once only
     _tmp_disabled = False
+    _memory_cache_clear_funcs = []  # clear functions of in-memory caches
 
     @classmethod
     def enable_cache(cls, cache_dir, ignore_version=False, force_renew=False, use_requests_cache=True):
@@ -145,6 +146,7 @@ class Cache:
             )
             if force_renew:
                 cls._requests_session.cache.clear()
+        cls._clear_memory_caches()
 
     @classmethod
     def requests_get(cls, *args, **kwargs):
@@ -206,6 +208,8 @@ class Cache:
                 cls._install_requests_cache(cache_dir)
             requests_cache.clear()
 
+        cls._clear_memory_caches()
+
     @classmethod
     def api_request_wrapper(cls, func):
         """Wrapper function for adding stage 2 caching to api functions.
@@ -226,7 +230,8 @@ class Cache:
                 if os.path.isfile(cache_file_path):
                     # file exists already, try to load it
                     try:
-                        cached = pickle.load(open(cache_file_path, 'rb'))
+                        with open(cache_file_path, 'rb') as cache_file_obj:
+                            cached = pickle.load(cache_file_obj)
                     except:  # noqa: E722 (bare except)
                         # don't like the bare exception clause but who knows
                         # which dependency will raise which internal exception
@@ -313,6 +318,17 @@ class Cache:
         with open(cache_file_path, 'wb') as cache_file_obj:
             pickle.dump(new_cached, cache_file_obj)
 
+    @classmethod
+    def _register_memory_cache(cls, clear_func):
+        # register the clear function of an in-memory cache (of processed
+        # data) so that it is cleared together with this cache
+        cls._memory_cache_clear_funcs.append(clear_func)
+
+    @classmethod
+    def _clear_memory_caches(cls):
+        for clear_func in cls._memory_cache_clear_funcs:
+            clear_func()
+
     @classmethod
     def _show_not_enabled_warning(cls):
         if not cls._CACHE_DIR and not cls._has_been_warned:
@@ -357,6 +373,7 @@ class Cache:
             This function is not multithreading-safe
         """
         cls._tmp_disabled = True
+        cls._clear_memory_caches()
 
     @classmethod
     def set_enabled(cls):
@@ -597,6 +614,10 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
 
     pitstops = -1  # start with -1 because first is out lap, needs to be zero after that
 
+    # time thresholds are created once here instead of once per response line
+    five_minutes = pd.Timedelta(5, 'min')
+    five_seconds = pd.Timedelta(5, 's')
+
     # iterate through the data; new lap triggers next row in data
     for time, resp in driver_raw:
         # the first three ifs are just edge case handling for the rare sessions were the data goes back in time
@@ -606,17 +627,19 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
             in_past = True
             continue
 
-        if (lapcnt == 0) and ((drv_data['Time'][lapcnt] - to_timedelta(time)) > pd.Timedelta(5, 'min')):
+        time = to_timedelta(time)
+
+        if (lapcnt == 0) and ((drv_data['Time'][lapcnt] - time) > five_minutes):
             # ignore any data which arrives more than 5 minutes before the end of the first lap, except 'PitOut'
             if ('InPit' in resp) and (resp['InPit'] is False):
-                drv_data['PitOutTime'][lapcnt] = to_timedelta(time)
+                drv_data['PitOutTime'][lapcnt] = time
                 pitstops = 0  # special here, can be multiple times for no reason therefore set zero instead of +=1
             continue
 
         # values which are up to five seconds late are still counted towards the previous lap
         # (sector times, speed traps and lap times)
         lap_offset = 0
-        if (lapcnt > 0) and (to_timedelta(time) - drv_data['Time'][lapcnt - 1] < pd.Timedelta(5, 's')):
+        if (lapcnt > 0) and (time - drv_data['Time'][lapcnt - 1] < five_seconds):
             lap_offset = 1
 
         if 'Sectors' in resp and isinstance(resp['Sectors'], dict):
@@ -626,7 +649,7 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
                                       ('2', 'Sector3Time', 'Sector3SessionTime')):
                 if val := recursive_dict_get(resp, 'Sectors', sn, 'Value'):
                     drv_data[sector][lapcnt - lap_offset] = to_timedelta(val)
-                    drv_data[sesst][lapcnt - lap_offset] = to_timedelta(time)
+                    drv_data[sesst][lapcnt - lap_offset] = time
 
         if val := recursive_dict_get(resp, 'LastLapTime', 'Value'):
             # if 'LastLapTime' is received less than five seconds after the start of a new lap, it is still added
@@ -648,14 +671,14 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
             # 'InPit': True is received once when entering pits, False is received once when leaving
             if resp['InPit'] is True:
                 if pitstops >= 0:
-                    drv_data['PitInTime'][lapcnt] = to_timedelta(time)
+                    drv_data['PitInTime'][lapcnt] = time
             elif ((('NumberOfLaps' in resp) and resp['NumberOfLaps'] > api_lapcnt)
-                  or (drv_data['Time'][lapcnt] - to_timedelta(time)) < pd.Timedelta(5, 's')):
+                  or (drv_data['Time'][lapcnt] - time) < five_seconds):
                 # same response line as beginning of next lap or beginning of next lap less than 5 seconds away
-                drv_data['PitOutTime'][lapcnt+1] = to_timedelta(time)  # add to next lap
+                drv_data['PitOutTime'][lapcnt+1] = time  # add to next lap
                 pitstops += 1
             else:
-                drv_data['PitOutTime'][lapcnt] = to_timedelta(time)  # add to current lap
+                drv_data['PitOutTime'][lapcnt] = time  # add to current lap
                 pitstops += 1
 
         if val := recursive_dict_get(resp, 'BestLapTime', 'Value'):
@@ -666,7 +689,7 @@ def _laps_data_driver(driver_raw, empty_vals, drv):
             api_lapcnt += 1
             # make sure the car actually drove out of the pits already; it can't be a new lap if it didn't
             if pitstops >= 0:
-                drv_data['Time'][lapcnt] = to_timedelta(time)
+                drv_data['Time'][lapcnt] = time
                 drv_data['NumberOfLaps'][lapcnt] = lapcnt + 1  # don't use F1's lap count; ours is better
                 drv_data['NumberOfPitStops'][lapcnt] = pitstops
                 drv_data['Driver'][lapcnt] = drv
@@ -1004,14 +1027,17 @@ def car_data(path, response=None, livedata=None):
                     if driver not in data:
                         data[driver] = {col: list() for col in columns}
 
-                    data[driver]['Time'].append(time)
-                    data[driver]['Date'].append(date)
+                    drv_data = data[driver]
+                    drv_data['Time'].append(time)
+                    drv_data['Date'].append(date)
 
+                    # look up the channels of this driver only once
+                    drv_channels = recursive_dict_get(entry, 'Cars', driver, 'Channels')
                     for n in channels:
-                        val = recursive_dict_get(entry, 'Cars', driver, 'Channels', n)
+                        val = drv_channels.get(n, {})
                         if not val:
                             val = 0
-                        data[driver][channels[n]].append(int(val))
+                        drv_data[channels[n]].append(int(val))
 
         except Exception:
             # too risky to specify an exception: unexpected invalid data!
@@ -1141,17 +1167,20 @@ def position_data(path, response=None, livedata=None):
                     if driver not in data:
                         data[driver] = {col: list() for col in columns}
 
-                    data[driver]['Time'].append(time)
-                    data[driver]['Date'].append(date)
+                    drv_data = data[driver]
+                    drv_data['Time'].append(time)
+                    drv_data['Date'].append(date)
 
+                    # look up the entry of this driver only once
+                    drv_entry = recursive_dict_get(sample, 'Entries', driver)
                     for coord in ['X', 'Y', 'Z']:
-                        data[driver][coord].append(recursive_dict_get(sample, 'Entries', driver, coord))
+                        drv_data[coord].append(drv_entry.get(coord, {}))
 
-                    status = recursive_dict_get(sample, 'Entries', driver, 'Status')
+                    status = drv_entry.get('Status', {})
                     if str(status).isdigit():
                         # Fallback on older api status mapping and convert
                         status = 'OffTrack' if int(status) else 'OnTrack'
-                    data[driver]['Status'].append(status)
+                    drv_data['Status'].append(status)
 
         except Exception:
             # too risky to specify an exception: unexpected invalid data!
@@ -278,19 +278,33 @@ class Telemetry(pd.DataFrame):
         Returns:
             :class:`Telemetry`
         """
+        i_sel = np.flatnonzero(mask)
         if pad:
+            if i_sel.size == 0:
+                raise ValueError("Cannot pad a slice that does not contain "
+                                 "any samples")
+            # the selected samples are sorted, first and last are the edges
             if pad_side in ('both', 'before'):
-                i_left_pad = max(0, np.min(np.where(mask)) - pad)
+                i_left_pad = max(0, i_sel[0] - pad)
             else:
-                i_left_pad = np.min(np.where(mask))
+                i_left_pad = i_sel[0]
 
             if pad_side in ('both', 'after'):
-                i_right_pad = min(len(mask), np.max(np.where(mask)) + pad)
+                i_right_pad = min(len(mask), i_sel[-1] + pad)
             else:
-                i_right_pad = np.max(np.where(mask))
+                i_right_pad = i_sel[-1]
             mask[i_left_pad: i_right_pad + 1] = True
-
-        data_slice = self.loc[mask].copy()
+            i_sel = np.arange(i_left_pad, min(i_right_pad + 1, len(mask)))
+
+        # if the mask selects one contiguous range of samples (e.g. when
+        # slicing by time), select this range by position; this is
+        # considerably faster than selecting the samples by boolean mask
+        if ((i_sel.size > 0) and (i_sel[-1] - i_sel[0] + 1 == i_sel.size)
+                and (not isinstance(mask, pd.Series)
+                     or mask.index.equals(self.index))):
+            data_slice = self.iloc[i_sel[0]: i_sel[-1] + 1].copy()
+        else:
+            data_slice = self.loc[mask].copy()
 
         return data_slice
 
@@ -358,9 +372,19 @@ class Telemetry(pd.DataFrame):
             d = self.merge_channels(edges)
 
         else:
-            d = self.copy()  # TODO no copy?
+            # no copy required, slicing by mask always creates a new object
+            d = self
 
-        sel = ((d['SessionTime'] <= end_time) & (d['SessionTime'] >= start_time))
+        session_time = d['SessionTime']
+        if (session_time.is_monotonic_increasing
+                and not pd.isna(start_time) and not pd.isna(end_time)):
+            # time is sorted; find the edges of the time frame by binary
+            # search instead of comparing every sample
+            sel = np.zeros(len(d), dtype=bool)
+            sel[session_time.searchsorted(start_time, side='left'):
+                session_time.searchsorted(end_time, side='right')] = True
+        else:
+            sel = ((session_time <= end_time) & (session_time >= start_time))
         if np.any(sel):
             data_slice = d.slice_by_mask(sel, pad, pad_side)
 
@@ -843,19 +867,19 @@ class Telemetry(pd.DataFrame):
         # prepend first row before diff so that array size stays the same; but missing first sample because of that
         other_dst[np.diff(other_dst, n=1, axis=0, prepend=other_dst[0, :].reshape((1, -1))) == 0] = np.nan
 
-        # resize own_dst to match shape of other_dst for easy subtraction
-        own_dst = np.repeat(own_dst.reshape((-1, 1)), other_dst.shape[1], axis=1)
-
-        delta_dst = other_dst - own_dst
+        # subtract own distance from each column by broadcasting; no need to
+        # create a full size copy of own_dst first
+        delta_dst = other_dst - own_dst.reshape((-1, 1))
         delta_dst[np.isnan(delta_dst)] = np.inf  # substitute nan with inf, else nan is returned as min
         delta_dst[delta_dst < 0] = np.inf  # remove cars behind so that neg numbers are not returned as min
 
         index_ahead = np.argmin(delta_dst, axis=1)
 
-        drv_ahead = np.array([drv_map[i] for i in index_ahead])
+        # select driver and distance for each sample directly by index
+        drv_ahead = drv_map[index_ahead].astype(str)
         drv_ahead[np.all(delta_dst == np.inf, axis=1)] = ''  # remove driver from all inf rows
 
-        dist_to_drv_ahead = np.array([delta_dst[i, index_ahead[i]] for i in range(len(index_ahead))])
+        dist_to_drv_ahead = delta_dst[np.arange(len(index_ahead)), index_ahead]
         dist_to_drv_ahead[np.all(delta_dst == np.inf, axis=1)] = np.nan  # remove value from all inf rows
 
         return drv_ahead, dist_to_drv_ahead
@@ -1159,7 +1183,19 @@ class Session:
                 self._session_start_time = session_status['Time'][i]
                 break
         self._session_status = pd.DataFrame(session_status)
-        df = None
+        laps_dfs = list()
+
+        # find the points at which the session was restarted after being
+        # aborted (red flag); these are the same for all drivers
+        restart_times = list()
+        _is_aborted = False
+        for status, status_time in zip(self._session_status['Status'],
+                                       self._session_status['Time']):
+            if _is_aborted and status == 'Started':  # restart
+                _is_aborted = False
+                restart_times.append(status_time)
+            elif status == 'Aborted':  # red flag
+                _is_aborted = True
 
         track_status = api.track_status_data(self.api_path, livedata=livedata)
 
@@ -1179,9 +1215,14 @@ class Session:
             logging.warning("Generating minimal driver "
                             "list from timing data.")
 
+        # split the data by driver once instead of filtering all of the data
+        # again for each driver
+        data_by_drv = dict(tuple(data.groupby('Driver', sort=False)))
+        useful_by_drv = dict(tuple(useful.groupby('Driver', sort=False)))
+
         for i, driver in enumerate(drivers):
-            d1 = data[data['Driver'] == driver]
-            d2 = useful[useful['Driver'] == driver]
+            d1 = data_by_drv.get(driver, data.iloc[:0])
+            d2 = useful_by_drv.get(driver, useful.iloc[:0])
             only_one_lap = False
 
             if not len(d1):
@@ -1227,34 +1268,25 @@ class Session:
 
             # don't set lap start times after red flag restart to the time
             # at which the previous lap was set
-            # only run this correction if the session was ever aborted
-            if (self.session_status['Status'] == 'Aborted').any():
-                _is_aborted = False
-                # first, find the point at which the session was aborted, then
-                # the following restart and the lap that starts immediately
-                # after; correct its pit out time
-                for _, row in self.session_status.iterrows():
-                    if _is_aborted and row['Status'] == 'Started':  # restart
-                        _is_aborted = False
-                        try:
-                            restart_index = result.loc[
-                                result['PitOutTime'] > row['Time'],
-                                'PitOutTime'
-                            ].index[0]
-                        except IndexError:
-                            continue  # no pit out, car did not restart
-                        if self.name in ('Sprint Qualifying', 'Sprint',
-                                         'Race'):
-                            # if this is a race-like session, we can assume the
-                            # session restart time as lap start time
-                            laps_start_time[restart_index] = row['Time']
-                        else:
-                            # for other sessions, we cannot make this
-                            # assumption set to NaT here, it will be set to
-                            # PitOutTime later if possible
-                            laps_start_time[restart_index] = pd.NaT
-                    elif row['Status'] == 'Aborted':  # red flag
-                        _is_aborted = True
+            # find the lap that starts immediately after each restart and
+            # correct its pit out time
+            for restart_time in restart_times:
+                try:
+                    restart_index = result.loc[
+                        result['PitOutTime'] > restart_time,
+                        'PitOutTime'
+                    ].index[0]
+                except IndexError:
+                    continue  # no pit out, car did not restart
+                if self.name in ('Sprint Qualifying', 'Sprint', 'Race'):
+                    # if this is a race-like session, we can assume the
+                    # session restart time as lap start time
+                    laps_start_time[restart_index] = restart_time
+                else:
+                    # for other sessions, we cannot make this
+                    # assumption set to NaT here, it will be set to
+                    # PitOutTime later if possible
+                    laps_start_time[restart_index] = pd.NaT
 
             result.loc[:, 'LapStartTime'] = pd.Series(
                 laps_start_time, dtype='timedelta64[ns]'
@@ -1307,25 +1339,30 @@ class Session:
                         'New': [result['New'].iloc[-1]],
                     })
                     if not only_one_lap:
-                        result = result.append(new_last).reset_index(drop=True)
+                        result = pd.concat([result, new_last]) \
+                            .reset_index(drop=True)
                     else:
                         result = new_last
 
-            df = pd.concat([df, result], sort=False)
-        if df is None:
+            laps_dfs.append(result)
+        if not laps_dfs:
             raise NoLapDataError
-        laps = df.reset_index(drop=True)  # noqa: F821
+        # concatenate once after the loop instead of growing a frame per driver
+        laps = pd.concat(laps_dfs, sort=False).reset_index(drop=True)
         laps.rename(columns={'TotalLaps': 'TyreLife',
                              'NumberOfPitStops': 'Stint',
                              'Driver': 'DriverNumber',
                              'NumberOfLaps': 'LapNumber',
                              'New': 'FreshTyre'}, inplace=True)
         laps['Stint'] += 1  # counting stints from 1
-        t_map = {r['DriverNumber']: r['TeamName']
-                 for _, r in self.results.iterrows()}
+        # create the mappings from the result columns directly instead of
+        # iterating over the rows, each row would be created as a
+        # DriverResult object else
+        drv_numbers = self.results['DriverNumber'].to_numpy()
+        t_map = dict(zip(drv_numbers, self.results['TeamName'].to_numpy()))
         laps['Team'] = laps['DriverNumber'].map(t_map)
-        d_map = {r['DriverNumber']: r['Abbreviation']
-                 for _, r in self.results.iterrows()}
+        d_map = dict(zip(drv_numbers,
+                         self.results['Abbreviation'].to_numpy()))
         laps['Driver'] = laps['DriverNumber'].map(d_map)
 
         # add track status data
@@ -1376,42 +1413,33 @@ class Session:
         # TODO: check for outliers in lap start position
         # self.laps['IsAccurate'] = False  # default should be not accurate
         for drv in self.drivers:
-            is_accurate = list()
-            prev_lap = None
-            integrity_errors = 0
-            for _, lap in self.laps[self.laps['DriverNumber'] == drv].iterrows():
-                # require existence, non-existence and specific values for some variables
-                check_1 = (pd.isnull(lap['PitInTime'])
-                           & pd.isnull(lap['PitOutTime'])
-                           & (lap['TrackStatus'] in ('1', '2'))  # slightly paranoid, allow only green and yellow flag
-                           & (not pd.isnull(lap['LapTime']))
-                           & (not pd.isnull(lap['Sector1Time']))
-                           & (not pd.isnull(lap['Sector2Time']))
-                           & (not pd.isnull(lap['Sector3Time'])))
-
-                if check_1:  # only do check 2 if all necessary values for this check are even available
-                    # sum of sector times should be almost equal to lap time (tolerance 3ms)
-                    check_2 = np.allclose(np.sum((lap['Sector1Time'], lap['Sector2Time'],
-                                                  lap['Sector3Time'])).total_seconds(),
-                                          lap['LapTime'].total_seconds(),
-                                          atol=0.003, rtol=0, equal_nan=False)
-                    if not check_2:
-                        integrity_errors += 1
-                else:
-                    check_2 = False  # data not available means fail
-
-                if prev_lap is not None:
-                    # first lap after safety car often has timing issues (as do all laps under safety car)
-                    check_3 = (prev_lap['TrackStatus'] != '4')
-                else:
-                    check_3 = True  # no previous lap, no SC error
-
-                result = check_1 and check_2 and check_3
-                is_accurate.append(result)
-                prev_lap = lap
+            is_drv = (self.laps['DriverNumber'] == drv)
+            laps = self.laps[is_drv]
+            if laps.empty:
+                continue
 
-            if len(is_accurate) > 0:
-                self._laps.loc[self.laps['DriverNumber'] == drv, 'IsAccurate'] = is_accurate
+            # require existence, non-existence and specific values for some variables
+            check_1 = (laps['PitInTime'].isna()
+                       & laps['PitOutTime'].isna()
+                       & laps['TrackStatus'].isin(('1', '2'))  # slightly paranoid, allow only green and yellow flag
+                       & laps['LapTime'].notna()
+                       & laps['Sector1Time'].notna()
+                       & laps['Sector2Time'].notna()
+                       & laps['Sector3Time'].notna()).to_numpy()
+
+            # sum of sector times should be almost equal to lap time (tolerance 3ms)
+            # check 2 only counts for laps for which check 1 passed, data not available means fail
+            sector_sum = laps['Sector1Time'] + laps['Sector2Time'] + laps['Sector3Time']
+            check_2 = np.isclose(sector_sum.dt.total_seconds().to_numpy(),
+                                 laps['LapTime'].dt.total_seconds().to_numpy(),
+                                 atol=0.003, rtol=0, equal_nan=False)
+            integrity_errors = np.sum(check_1 & ~check_2)
+
+            # first lap after safety car often has timing issues (as do all laps under safety car)
+            # no previous lap, no SC error
+            check_3 = (laps['TrackStatus'].shift(1) != '4').to_numpy()
+
+            self._laps.loc[is_drv, 'IsAccurate'] = check_1 & check_2 & check_3
 
             if integrity_errors > 0:
                 logging.warning(f"Driver {drv: >2}: Lap timing integrity check failed for {integrity_errors} lap(s)")
@@ -1597,18 +1625,19 @@ class Session:
         self._calculate_t0_date(car_data, pos_data)
 
         for drv in self.drivers:
-            try:
-                # drop and recalculate time stamps based on 'Date', because 'Date' has a higher resolution
-                drv_car = Telemetry(car_data[drv].drop(labels='Time', axis=1),
-                                    session=self, driver=drv,
-                                    drop_unknown_channels=True)
-                drv_pos = Telemetry(pos_data[drv].drop(labels='Time', axis=1),
-                                    session=self, driver=drv,
-                                    drop_unknown_channels=True)
-            except KeyError:
-                # not pos data or car data exists for this driver
+            if (drv not in car_data) or (drv not in pos_data):
+                # no pos data or car data exists for this driver; skip before
+                # creating any telemetry for it
                 continue
 
+            # drop and recalculate time stamps based on 'Date', because 'Date' has a higher resolution
+            drv_car = Telemetry(car_data[drv].drop(labels='Time', axis=1),
+                                session=self, driver=drv,
+                                drop_unknown_channels=True)
+            drv_pos = Telemetry(pos_data[drv].drop(labels='Time', axis=1),
+                                session=self, driver=drv,
+                                drop_unknown_channels=True)
+
             drv_car['Date'] = drv_car['Date'].round('ms')
             drv_pos['Date'] = drv_pos['Date'].round('ms')
 
@@ -1946,11 +1975,40 @@ class Laps(pd.DataFrame):
             <BLANKLINE>
             [275 rows x 33 columns]
         """
-        wd = [lap.get_weather_data() for _, lap in self.iterrows()]
-        if wd:
+        weather_data = self.session.weather_data
+        if self.empty:
+            return pd.DataFrame(columns=weather_data.columns)
+
+        if (weather_data.empty
+                or not weather_data['Time'].is_monotonic_increasing):
+            wd = [lap.get_weather_data() for _, lap in self.iterrows()]
             return pd.concat(wd, axis=1).T
-        else:
-            return pd.DataFrame(columns=self.session.weather_data.columns)
+
+        # weather data is sorted by time; find the first sample within each
+        # lap or else the last sample before the end of each lap for all
+        # laps at once
+        w_time = weather_data['Time'].to_numpy()
+        start_time = self['LapStartTime'].to_numpy()
+        end_time = self['Time'].to_numpy()
+        first = np.searchsorted(w_time, start_time, side='left')
+        last = np.searchsorted(w_time, end_time, side='right') - 1
+
+        has_first = (~pd.isna(start_time) & (first < len(w_time))
+                     & (w_time[np.minimum(first, len(w_time) - 1)] <= end_time))
+        has_last = ~pd.isna(end_time) & (last >= 0)
+        has_data = has_first | has_last
+
+        samples = weather_data.iloc[np.where(has_first, first, np.maximum(last, 0))]
+        if not has_data.all():
+            # no data for some laps: all values are NaN and these laps are
+            # labeled with consecutive integers
+            samples = samples.where(
+                np.broadcast_to(has_data[:, np.newaxis], samples.shape)
+            )
+            index = samples.index.to_numpy().copy()
+            index[~has_data] = np.arange(np.sum(~has_data))
+            samples.index = index
+        return samples
 
     def pick_driver(self, identifier):
         """Return all laps of a specific driver in self based on the driver's
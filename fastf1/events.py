@@ -153,19 +153,15 @@ API Reference
 """  # noqa: W605 invalid escape sequence (escaped space)
 import collections
 import datetime
+import json
 import logging
+import os
+import pickle
 import warnings
 
 import dateutil.parser
 
-with warnings.catch_warnings():
-    warnings.filterwarnings(
-        'ignore', message="Using slow pure-python SequenceMatcher"
-    )
-    # suppress that warning, it's confusing at best here, we don't need fast
-    # sequence matching and the installation (on windows) requires some effort
-    from thefuzz import fuzz
-
+import numpy as np
 import pandas as pd
 
 from fastf1.api import Cache
@@ -184,9 +180,25 @@ _SESSION_TYPE_ABBREVIATIONS = {
     'FP3': 'Practice 3'
 }
 
+# lookup of full session names by casefolded abbreviation or full name
+_SESSION_NAME_LOOKUP = {
+    **{abbr.casefold(): name
+       for abbr, name in _SESSION_TYPE_ABBREVIATIONS.items()},
+    **{name.casefold(): name
+       for name in _SESSION_TYPE_ABBREVIATIONS.values()}
+}
+
 _SCHEDULE_BASE_URL = "https://raw.githubusercontent.com/" \
                      "theOehrly/f1schedule/master/"
 
+_SCHEDULE_CACHE_EXPIRY = datetime.timedelta(hours=12)
+
+# in-memory cache of processed event schedules, see _get_event_schedule;
+# it is cleared by the api cache whenever cached data should not be used
+_SCHEDULE_MEMORY_CACHE = collections.OrderedDict()
+_SCHEDULE_MEMORY_CACHE_SIZE = 32
+Cache._register_memory_cache(_SCHEDULE_MEMORY_CACHE.clear)
+
 
 def get_session(year, gp, identifier=None, *, force_ergast=False, event=None):
     """Create a :class:`~fastf1.core.Session` object based on year, event name
@@ -322,10 +334,10 @@ def get_event(year, gp, *, force_ergast=False):
 
     .. versionadded:: 2.2
     """
-    schedule = get_event_schedule(year=year, include_testing=False,
-                                  force_ergast=force_ergast)
+    schedule = _get_event_schedule(year, include_testing=False,
+                                   force_ergast=force_ergast)
 
-    if type(gp) is str:
+    if isinstance(gp, str):
         event = schedule.get_event_by_name(gp)
     else:
         event = schedule.get_event_by_round(gp)
@@ -346,12 +358,15 @@ def get_testing_event(year, test_number):
 
     .. versionadded:: 2.2
     """
-    schedule = get_event_schedule(year=year)
-    schedule = schedule[schedule.is_testing()]
+    schedule = _get_event_schedule(year, include_testing=True,
+                                   force_ergast=False)
+    # select the event from the row numbers of all testing events instead
+    # of creating a filtered copy of the schedule first
+    testing_rows = np.flatnonzero(schedule.is_testing().to_numpy())
 
     try:
         assert test_number >= 1
-        return schedule.iloc[test_number-1]
+        return schedule.iloc[testing_rows[test_number-1]]
     except (IndexError, AssertionError):
         raise ValueError(f"Test event number {test_number} does not exist")
 
@@ -372,6 +387,33 @@ def get_event_schedule(year, *, include_testing=True, force_ergast=False):
 
     .. versionadded:: 2.2
     """
+    # return a copy so that the cached schedule cannot be modified
+    return _get_event_schedule(year, include_testing=include_testing,
+                               force_ergast=force_ergast).copy()
+
+
+def _get_event_schedule(year, *, include_testing, force_ergast):
+    # Create the event schedule for a specific season. The result is cached
+    # in memory so that repeated calls (e.g. getting multiple sessions in a
+    # loop) do not need to parse and process the schedule data again.
+    # Schedules from the Ergast fallback are not cached, so that the
+    # primary backend is tried again on the next call. Cached schedules
+    # expire after the same time as the cached request, so that schedule
+    # updates are still picked up by long-running processes. The memory
+    # cache is not used while the api cache is disabled or forced to renew
+    # its data.
+    # The returned schedule must not be modified!
+    key = (year, include_testing, force_ergast)
+    now = datetime.datetime.now()
+    use_memory_cache = not (Cache._tmp_disabled or Cache._FORCE_RENEW)
+    if use_memory_cache and key in _SCHEDULE_MEMORY_CACHE:
+        timestamp, schedule = _SCHEDULE_MEMORY_CACHE[key]
+        if now - timestamp <= _SCHEDULE_CACHE_EXPIRY:
+            _SCHEDULE_MEMORY_CACHE.move_to_end(key)
+            return schedule
+        del _SCHEDULE_MEMORY_CACHE[key]
+
+    is_fallback = False
     if ((year not in range(2018, datetime.datetime.now().year+1))
             or force_ergast):
         schedule = _get_schedule_from_ergast(year)
@@ -382,17 +424,38 @@ def get_event_schedule(year, *, include_testing=True, force_ergast=False):
             logging.error(f"Failed to access primary schedule backend. "
                           f"Falling back to Ergast! Reason: {exc})")
             schedule = _get_schedule_from_ergast(year)
+            is_fallback = True
 
     if not include_testing:
         schedule = schedule[~schedule.is_testing()]
+
+    if use_memory_cache and not is_fallback:
+        _SCHEDULE_MEMORY_CACHE[key] = (now, schedule)
+        if len(_SCHEDULE_MEMORY_CACHE) > _SCHEDULE_MEMORY_CACHE_SIZE:
+            _SCHEDULE_MEMORY_CACHE.popitem(last=False)
     return schedule
 
 
 def _get_schedule(year):
+    # The parsed schedule is cached on disk in addition to the cached raw
+    # request so that the json data does not need to be processed again in
+    # every new process. The cached schedule expires after the same time as
+    # the cached request so that schedule updates are still picked up.
+    cache_file_path = None
+    if Cache._CACHE_DIR and not Cache._tmp_disabled:
+        cache_file_path = os.path.join(Cache._CACHE_DIR,
+                                       f'schedule_{year}.ff1pkl')
+        schedule = _load_cached_schedule(cache_file_path)
+        if schedule is not None:
+            return schedule
+
     response = Cache.requests_get(
         _SCHEDULE_BASE_URL + f"schedule_{year}.json"
     )
-    df = pd.read_json(response.text)
+    # the dtypes are set by the EventSchedule anyways, therefore the json
+    # data is loaded directly instead of using pandas' slower json reader
+    # with its additional type inference
+    df = pd.DataFrame(json.loads(response.content)).reset_index(drop=True)
 
     # change column names from snake_case to UpperCamelCase
     col_renames = {col: ''.join([s.capitalize() for s in col.split('_')])
@@ -400,6 +463,39 @@ def _get_schedule(year):
     df = df.rename(columns=col_renames)
 
     schedule = EventSchedule(df, year=year, force_default_cols=True)
+
+    if cache_file_path is not None:
+        Cache._write_cache(schedule, cache_file_path,
+                           timestamp=datetime.datetime.now())
+
+    return schedule
+
+
+def _load_cached_schedule(cache_file_path):
+    # load a schedule from the cache, returns None if no cached schedule
+    # exists or if the cached schedule cannot be used anymore
+    if not os.path.isfile(cache_file_path):
+        return None
+    try:
+        with open(cache_file_path, 'rb') as cache_file_obj:
+            cached = pickle.load(cache_file_obj)
+    except:  # noqa: E722 (bare except)
+        # same as for the api cache, loading may fail for various reasons
+        # after dependencies were updated
+        return None
+
+    timestamp = cached.get('timestamp')
+    if ((timestamp is None) or (not Cache._data_ok_for_use(cached))
+            or (datetime.datetime.now() - timestamp > _SCHEDULE_CACHE_EXPIRY)):
+        return None
+
+    # the api parser version is unrelated to the schedule, therefore the
+    # cached schedule is additionally required to match the current format
+    schedule = cached.get('data')
+    if ((not isinstance(schedule, EventSchedule))
+            or (list(schedule.columns) != list(EventSchedule._COL_TYPES))):
+        return None
+
     return schedule
 
 
@@ -501,25 +597,31 @@ class EventSchedule(pd.DataFrame):
 
     _metadata = ['year']
 
-    _internal_names = ['base_class_view']
+    # extend (instead of replace) pandas' internal names, else pickling
+    # and unpickling does not restore internal attributes correctly
+    _internal_names = pd.DataFrame._internal_names + ['base_class_view']
+    _internal_names_set = set(_internal_names)
 
     def __init__(self, *args, year=0, force_default_cols=False, **kwargs):
         if force_default_cols:
             kwargs['columns'] = list(self._COL_TYPES)
-        super().__init__(*args, **kwargs)
+        data = pd.DataFrame(*args, **kwargs)
+
+        # apply column specific dtypes; columns without any data are filled
+        # with a default value first, then all columns are converted at once
+        col_types = {col: _type for col, _type in self._COL_TYPES.items()
+                     if col in data.columns}
+        if col_types:
+            fill_values = {col: _type() for col, _type in col_types.items()
+                           if (_type != 'datetime64[ns]')
+                           and data[col].isna().all()}
+            if fill_values:
+                data = data.fillna(fill_values)
+            data = data.astype(col_types)
+
+        super().__init__(data)
         self.year = year
 
-        # apply column specific dtypes
-        for col, _type in self._COL_TYPES.items():
-            if col not in self.columns:
-                continue
-            if self[col].isna().all():
-                if _type == 'datetime64[ns]':
-                    self[col] = pd.NaT
-                else:
-                    self[col] = _type()
-            self[col] = self[col].astype(_type)
-
     def __repr__(self):
         return self.base_class_view.__repr__()
 
@@ -546,7 +648,8 @@ class EventSchedule(pd.DataFrame):
     def is_testing(self):
         """Return `True` or `False`, depending on whether each event is a
         testing event."""
-        return pd.Series(self['EventFormat'] == 'testing')
+        return pd.Series(self['EventFormat'].to_numpy() == 'testing',
+                         index=self.index, name='EventFormat')
 
     def get_event_by_round(self, round):
         """Get an :class:`Event` by its round number.
@@ -560,10 +663,12 @@ class EventSchedule(pd.DataFrame):
         """
         if round == 0:
             raise ValueError("Cannot get testing event by round number!")
-        mask = self['RoundNumber'] == round
+        # select the first matching row directly instead of creating a
+        # filtered copy of the schedule first
+        mask = self['RoundNumber'].to_numpy() == round
         if not mask.any():
             raise ValueError(f"Invalid round: {round}")
-        return self[mask].iloc[0]
+        return self.iloc[mask.argmax()]
 
     def get_event_by_name(self, name):
         """Get an :class:`Event` by its name.
@@ -574,6 +679,10 @@ class EventSchedule(pd.DataFrame):
         the correct result. You should therefore always check if the function
         actually returns the event you had wanted.
 
+        If the given name is equal to or part of one of these values for
+        exactly one event, this event is returned directly without fuzzy
+        matching.
+
         .. warning:: You should avoid adding common words to ``name`` to avoid
             false string matches.
             For example, you should rather use "Belgium" instead of "Belgian
@@ -587,32 +696,57 @@ class EventSchedule(pd.DataFrame):
         Returns:
             :class:`Event`
         """
-        def _matcher_strings(ev):
-            strings = list()
-            if 'Location' in ev:
-                strings.append(ev['Location'])
-            if 'Country' in ev:
-                strings.append(ev['Country'])
-            if 'EventName' in ev:
-                strings.append(ev['EventName'].replace("Grand Prix", ""))
-            if 'OfficialEventName' in ev:
-                strings.append(ev['OfficialEventName']
-                               .replace("FORMULA 1", "")
-                               .replace(str(self.year), "")
-                               .replace("GRAND PRIX", ""))
-            return strings
-
-        max_ratio = 0
-        index = 0
-        for i, event in self.iterrows():
-            ratio = max(
-                [fuzz.ratio(val.casefold(), name.casefold())
-                 for val in _matcher_strings(event)]
-            )
-            if ratio > max_ratio:
-                max_ratio = ratio
-                index = i
-        return self.loc[index]
+        # imported here, it is only required for fuzzy matching event names
+        from rapidfuzz import fuzz, process
+
+        name = name.casefold()
+        candidates, rows = self._get_matcher_strings()
+
+        # fast path: if the name is equal to (or else contained in) the
+        # matcher strings of exactly one event, this event is returned
+        # without doing any fuzzy matching
+        exact = {row for cand, row in zip(candidates, rows)
+                 if cand.strip() == name}
+        if not exact:
+            exact = {row for cand, row in zip(candidates, rows)
+                     if name in cand}
+        if len(exact) == 1:
+            return self.iloc[exact.pop()]
+
+        # find the best scoring candidate of all events in one call;
+        # rapidfuzz raises the score cutoff to the best score found so far,
+        # so that calculation of worse scores can be aborted early, which
+        # makes this faster than calculating all scores (e.g. using
+        # process.cdist) for a single name; on a tie, the first event wins
+        _, _, index = process.extractOne(name, candidates, scorer=fuzz.ratio,
+                                         processor=None, score_cutoff=0)
+        return self.iloc[rows[index]]
+
+    def _get_matcher_strings(self):
+        # Flat list of all casefolded strings that are used for fuzzy
+        # matching event names and the row number of the event to which
+        # each string belongs. This is recomputed on every call so that
+        # in-place modifications of the schedule are always respected.
+        columns = list()
+        if 'Location' in self.columns:
+            columns.append(self['Location'])
+        if 'Country' in self.columns:
+            columns.append(self['Country'])
+        if 'EventName' in self.columns:
+            columns.append(self['EventName']
+                           .str.replace("Grand Prix", "", regex=False))
+        if 'OfficialEventName' in self.columns:
+            columns.append(self['OfficialEventName']
+                           .str.replace("FORMULA 1", "", regex=False)
+                           .str.replace(str(self.year), "", regex=False)
+                           .str.replace("GRAND PRIX", "", regex=False))
+
+        # one row of matcher strings per event, flattened row by row
+        strings = np.column_stack([col.str.casefold().to_numpy()
+                                   for col in columns])
+        candidates = strings.ravel().tolist()
+        rows = np.repeat(np.arange(strings.shape[0]), strings.shape[1])
+        return candidates, rows
 
 
 class Event(pd.Series):
@@ -643,21 +777,35 @@ class Event(pd.Series):
 
         return _new
 
-    def __getattribute__(self, name):
+    @property
+    def name(self):
         # TODO: remove in v2.3
-        if name == 'name' and getattr(self, '_getattr_override', False):
-            if 'EventName' in self:
-                warnings.warn(
-                    "The `Weekend.name` property is deprecated and will be"
-                    "removed in a future version.\n"
-                    "Use `Event['EventName']` or `Event.EventName` instead.",
-                    FutureWarning
-                )
-                # name may be accessed by pandas internals to, when data
-                # does not exist yet
-                return self['EventName']
-
-        return super().__getattribute__(name)
+        # Overriding only this property instead of __getattribute__ avoids
+        # slowing down every other attribute access on an event.
+        if getattr(self, '_getattr_override', False) and 'EventName' in self:
+            warnings.warn(
+                "The `Weekend.name` property is deprecated and will be"
+                "removed in a future version.\n"
+                "Use `Event['EventName']` or `Event.EventName` instead.",
+                FutureWarning
+            )
+            # name may be accessed by pandas internals to, when data
+            # does not exist yet
+            return self['EventName']
+
+        return super().name
+
+    @name.setter
+    def name(self, value):
+        pd.Series.name.fset(self, value)
+
+    def __setattr__(self, key, value):
+        # pandas checks whether an attribute exists before setting it, which
+        # would call the deprecated getter of 'name' (e.g. in rename)
+        if key == 'name':
+            pd.Series.name.fset(self, value)
+        else:
+            super().__setattr__(key, value)
 
     def __repr__(self):
         # don't show .name deprecation message when .name is accessed internally
@@ -724,20 +872,13 @@ class Event(pd.Series):
         Raises:
             ValueError: No matching session or invalid identifier
         """
-        try:
-            num = float(identifier)
-        except ValueError:
+        if isinstance(identifier, (int, np.integer)):
+            # by number
+            num = int(identifier)
+        elif (isinstance(identifier, str)
+              and (identifier.casefold() in _SESSION_NAME_LOOKUP)):
             # by name or abbreviation
-            for name in _SESSION_TYPE_ABBREVIATIONS.values():
-                if identifier.casefold() == name.casefold():
-                    session_name = name
-                    break
-            else:
-                try:
-                    session_name = \
-                        _SESSION_TYPE_ABBREVIATIONS[identifier.upper()]
-                except KeyError:
-                    raise ValueError(f"Invalid session type '{identifier}'")
+            session_name = _SESSION_NAME_LOOKUP[identifier.casefold()]
 
             # 'Sprint' is called 'Sprint Qualifying' only in 2021
             if (self.year == 2021) and (session_name == 'Sprint'):
@@ -745,19 +886,25 @@ class Event(pd.Series):
             elif (self.year > 2021) and (session_name == 'Sprint Qualifying'):
                 session_name = 'Sprint'
 
-            if session_name not in self.values:
+            if not self._has_session(session_name):
                 raise ValueError(f"No session of type '{identifier}' for "
                                  f"this event")
+            return session_name
         else:
-            # by number
-            if (float(num).is_integer()
-                    and (num := int(num)) in (1, 2, 3, 4, 5)):
-                session_name = self[f'Session{num}']
-            else:
-                raise ValueError(f"Invalid session type '{num}'")
-            if not session_name:
-                raise ValueError(f"Session number {num} does not "
-                                 f"exist for this event")
+            # number given as float or string, e.g. '3' or 3.0
+            try:
+                num = float(identifier)
+            except ValueError:
+                raise ValueError(f"Invalid session type '{identifier}'")
+            if num.is_integer():
+                num = int(num)
+
+        if num not in (1, 2, 3, 4, 5):
+            raise ValueError(f"Invalid session type '{num}'")
+        session_name = self[f'Session{num}']
+        if not session_name:
+            raise ValueError(f"Session number {num} does not "
+                             f"exist for this event")
 
         return session_name
 
@@ -775,15 +922,25 @@ class Event(pd.Series):
             ValueError: No matching session or invalid identifier
         """
         session_name = self.get_session_name(identifier)
-        relevant_columns = self.loc[['Session1', 'Session2', 'Session3',
-                                     'Session4', 'Session5']]
-        mask = (relevant_columns == session_name)
-        if not mask.any():
+        try:
+            return self._get_session_dates()[session_name]
+        except KeyError:
             raise ValueError(f"Session type '{identifier}' does not exist "
                              f"for this event")
-        else:
-            _name = mask.idxmax()
-            return self[f"{_name}Date"]
+
+    def _has_session(self, session_name):
+        # check against the current session names of this event
+        return session_name in [self.get(f'Session{i}') for i in range(1, 6)]
+
+    def _get_session_dates(self):
+        # mapping of session name to session date for all sessions of this
+        # event; created on every call so that modifications are respected
+        dates = dict()
+        for i in range(1, 6):
+            name = self.get(f'Session{i}')
+            if name:
+                dates.setdefault(name, self.get(f'Session{i}Date'))
+        return dates
 
     def get_session(self, identifier):
         """Return a session from this event.
@@ -797,25 +954,16 @@ class Event(pd.Series):
         Raises:
             ValueError: No matching session or invalid identifier
         """
-        try:
-            num = float(identifier)
-        except ValueError:
-            # by name or abbreviation
-            session_name = self.get_session_name(identifier)
-            if session_name not in self.values:
-                raise ValueError(f"No session of type '{identifier}' for "
-                                 f"this event")
-        else:
-            # by number
-            if (float(num).is_integer()
-                    and (num := int(num)) in (1, 2, 3, 4, 5)):
-                session_name = self[f'Session{num}']
-            else:
-                raise ValueError(f"Invalid session type '{num}'")
-            if not session_name:
-                raise ValueError(f"Session number {num} does not "
-                                 f"exist for this event")
+        session_name = self.get_session_name(identifier)
+        return Session(event=self, session_name=session_name,
+                       f1_api_support=self.F1ApiSupport)
 
+    def _get_session_by_full_name(self, session_name, identifier=None):
+        # The full session name is already known, so there is no need to
+        # resolve it from an identifier first. If the session does not
+        # exist, get_session is used to raise the appropriate error.
+        if not self._has_session(session_name):
+            return self.get_session(identifier or session_name)
         return Session(event=self, session_name=session_name,
                        f1_api_support=self.F1ApiSupport)
 
@@ -825,7 +973,7 @@ class Event(pd.Series):
         Returns:
             :class:`Session` instance
         """
-        return self.get_session('Race')
+        return self._get_session_by_full_name('Race')
 
     def get_qualifying(self):
         """Return the qualifying session.
@@ -833,7 +981,7 @@ class Event(pd.Series):
         Returns:
             :class:`Session` instance
         """
-        return self.get_session('Qualifying')
+        return self._get_session_by_full_name('Qualifying')
 
     def get_sprint(self):
         """Return the sprint session.
@@ -841,7 +989,11 @@ class Event(pd.Series):
         Returns:
             :class:`Session` instance
         """
-        return self.get_session('Sprint')
+        # 'Sprint' is called 'Sprint Qualifying' only in 2021
+        if self.year == 2021:
+            return self._get_session_by_full_name('Sprint Qualifying',
+                                                  'Sprint')
+        return self._get_session_by_full_name('Sprint')
 
     def get_practice(self, number):
         """Return the specified practice session.
@@ -850,4 +1002,4 @@ class Event(pd.Series):
         Returns:
             :class:`Session` instance
         """
-        return self.get_session(f'Practice {number}')
+        return self._get_session_by_full_name(f'Practice {number}')
@@ -165,65 +165,76 @@ def _make_trajectory(session, ref_lap):
         stream_length = len(session.pos_data[drivers_list[0]])
         dmap = np.empty((stream_length, len(drivers_list)), dtype=int)
 
-        fast_query = {'n_jobs': 2, 'distance_upper_bound': 500}
+        fast_query = {'workers': -1, 'distance_upper_bound': 500}
         # fast_query < Increases speed
+        drv_indices = list()
+        trajectories = list()
         for index, drv in enumerate(drivers_list):
             if drv not in session.pos_data.keys():
                 logging.warning(f"Driver {drv: >2}: No position data. (_make_trajectory)")
                 continue
-            trajectory = session.pos_data[drv][['X', 'Y', 'Z']].values
-            projection_index = track_tree.query(trajectory, **fast_query)[1]
-            # When tree cannot solve super far points means there is some
-            # pit shit shutdown. We can replace these index with 0
-            projection_index[projection_index == len(reference_s)] = 0
-            dmap[:, index] = fix_suzuka(projection_index.copy(), reference_s)
+            drv_indices.append(index)
+            trajectories.append(session.pos_data[drv][['X', 'Y', 'Z']].values)
+
+        if trajectories:
+            # query the trajectories of all drivers at once and split the
+            # result per driver afterwards
+            projections = track_tree.query(np.concatenate(trajectories), **fast_query)[1]
+            splits = np.cumsum([len(trajectory) for trajectory in trajectories])[:-1]
+            for index, projection_index in zip(drv_indices, np.split(projections, splits)):
+                # When tree cannot solve super far points means there is some
+                # pit shit shutdown. We can replace these index with 0
+                projection_index[projection_index == len(reference_s)] = 0
+                dmap[:, index] = fix_suzuka(projection_index.copy(), reference_s)
 
         """Create transform matrix to change distance point of reference
         """
+        # row i contains the distance from reference point i to all other
+        # reference points in driving direction; each row is calculated in
+        # place without temporary arrays (faster than broadcasting over the
+        # whole matrix at once as the matrix is large)
         t_matrix = np.empty((ssize, ssize))
         for index in range(ssize):
-            rref = reference_s - reference_s[index]
-            rref[rref <= 0] = total_s + rref[rref <= 0]
-            t_matrix[index, :] = rref
+            rref = t_matrix[index]
+            np.subtract(reference_s, reference_s[index], out=rref)
+            np.add(rref, total_s, out=rref, where=(rref <= 0))
 
         """Create mask to remove distance elements when car is on track
         """
-        time = session.pos_data[drivers_list[0]]['Time']
+        # plain numpy arrays are used instead of per-lap rows and series
+        # as this loop runs for every lap of every driver
+        time = session.pos_data[drivers_list[0]]['Time'].to_numpy()
         pit_mask = np.zeros((stream_length, len(drivers_list)), dtype=bool)
         for driver_index, driver_number in enumerate(drivers_list):
             laps = session.laps.pick_driver(driver_number)
             in_pit = True
             times = [[], []]
-            for lap_index in laps.index:
-                lap = laps.loc[lap_index]
-                if not pd.isnull(lap['PitInTime']) and not in_pit:
-                    times[1].append(lap['PitInTime'])
+            for pit_in, pit_out in zip(laps['PitInTime'].to_numpy(),
+                                       laps['PitOutTime'].to_numpy()):
+                if not pd.isnull(pit_in) and not in_pit:
+                    times[1].append(pit_in)
                     in_pit = True
-                if not pd.isnull(lap['PitOutTime']) and in_pit:
-                    times[0].append(lap['PitOutTime'])
+                if not pd.isnull(pit_out) and in_pit:
+                    times[0].append(pit_out)
                     in_pit = False
 
             if not in_pit:
                 # Car crashed, we put a time and 'Status' will take care
-                times[1].append(lap['Time'])
+                times[1].append(laps['Time'].to_numpy()[-1])
             times = np.transpose(np.array(times))
             for inout in times:
                 out_of_pit = np.logical_and(time >= inout[0], time < inout[1])
                 pit_mask[:, driver_index] |= out_of_pit
-            on_track = (session.pos_data[driver_number]['Status'] == 'OnTrack')
-            pit_mask[:, driver_index] &= on_track.values
+            on_track = (session.pos_data[driver_number]['Status'].to_numpy() == 'OnTrack')
+            pit_mask[:, driver_index] &= on_track
 
         """Calculate relative distances using transform matrix
         """
         driver_ahead = {}
         stream_axis = np.arange(stream_length)
         for my_di, my_d in enumerate(drivers_list):
-            rel_distance = np.empty(np.shape(dmap))
-
-            for his_di, his_d in enumerate(drivers_list):
-                my_pos_i = dmap[:, my_di]
-                his_pos_i = dmap[:, his_di]
-                rel_distance[:, his_di] = t_matrix[my_pos_i, his_pos_i]
+            # distance to all other drivers for all samples at once
+            rel_distance = t_matrix[dmap[:, my_di, np.newaxis], dmap]
 
             his_in_pit = ~pit_mask.copy()
             his_in_pit[:, my_di] = False
@@ -45,9 +45,7 @@ class LiveTimingData:
     Args:
         *files (str): One or multiple file names
         remove_duplicates (bool): Remove duplicate lines. Mainly useful when
-            loading multiple overlapping recordings. (Checking for duplicates
-            is currently very slow for large files. Therefore, it can be
-            disabled if this may cause problems.)
+            loading multiple overlapping recordings.
     """
     def __init__(self, *files, remove_duplicates=True):
         # file names
@@ -63,7 +61,7 @@ class LiveTimingData:
         # whether any files were loaded previously, i.e. appending data
         self._previous_files = False
         # hash each line, used to skip duplicates from multiple files
-        self._line_hashes = list()
+        self._line_hashes = set()
         self._remove_duplicates = remove_duplicates
 
     def load(self):
@@ -100,12 +98,12 @@ class LiveTimingData:
         # parse a single line of data
 
         if self._remove_duplicates:
-            # prevent duplicates when loading data (slow, but it works...)
+            # prevent duplicates when loading data
             # allows to load data from overlapping recordings
             lhash = hashlib.md5(elem.encode()).hexdigest()
             if lhash in self._line_hashes:
                 return
-            self._line_hashes.append(lhash)
+            self._line_hashes.add(lhash)
 
         # load the three parts of each data element
         elem = self._fix_json(elem)
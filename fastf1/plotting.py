@@ -43,12 +43,7 @@ except ImportError:
                   "Plotting of timedelta values will be restricted!",
                   UserWarning)
 
-import warnings
-with warnings.catch_warnings():
-    warnings.filterwarnings('ignore', message="Using slow pure-python SequenceMatcher")
-    # suppress that warning, it's confusing at best here, we don't need fast sequence matching
-    # and the installation (on windows) some effort
-    from thefuzz import fuzz
+from rapidfuzz import fuzz
 
 
 class __TeamColorsWarnDict(dict):
@@ -243,7 +238,7 @@ def driver_color(identifier):
         # do fuzzy string matching
         key_ratios = list()
         for existing_key in DRIVER_COLORS.keys():
-            ratio = fuzz.ratio(identifier, existing_key)
+            ratio = round(fuzz.ratio(identifier, existing_key))
             key_ratios.append((ratio, existing_key))
         key_ratios.sort(reverse=True)
         if (key_ratios[0][0] < 35) or (key_ratios[0][0]/key_ratios[1][0] < 1.2):
@@ -316,7 +311,7 @@ def team_color(identifier):
         # do fuzzy string matching
         key_ratios = list()
         for existing_key in TEAM_COLORS.keys():
-            ratio = fuzz.ratio(identifier, existing_key)
+            ratio = round(fuzz.ratio(identifier, existing_key))
             key_ratios.append((ratio, existing_key))
         key_ratios.sort(reverse=True)
         if (key_ratios[0][0] < 35) or (key_ratios[0][0]/key_ratios[1][0] < 1.2):
@@ -372,7 +367,11 @@ def _enable_misc_mpl_mods():
                     s = False
                 if s == 'decreasing' or s == -1:
                     s = True
-                _ids = [list(val).index(a) for a in sorted(val, reverse=s)]
+                # sort indices by value directly instead of searching
+                # each sorted value in the list again
+                _val = list(val)
+                _ids = sorted(range(len(_val)), key=_val.__getitem__,
+                              reverse=s)
                 _args = [[args[-2][i] for i in _ids],
                          [args[-1][i] for i in _ids]]
                 if len(args) > 2:
@@ -1,3 +1,5 @@
+import datetime
+
 import pandas as pd
 import pytest
 
@@ -99,6 +101,10 @@ def test_event_schedule_is_testing():
     )
     assert (schedule.is_testing() == [False, True]).all()
 
+    # modifying the schedule in place needs to be respected
+    schedule.loc[0, 'EventFormat'] = 'testing'
+    assert (schedule.is_testing() == [True, True]).all()
+
 
 def test_event_schedule_get_event_by_round_number():
     schedule = fastf1.events.EventSchedule(
@@ -113,6 +119,10 @@ def test_event_schedule_get_event_by_round_number():
     with pytest.raises(ValueError, match="Invalid round"):
         schedule.get_event_by_round(10)
 
+    # empty schedule, e.g. for a season without any data
+    with pytest.raises(ValueError, match="Invalid round"):
+        schedule.iloc[:0].get_event_by_round(1)
+
 
 def test_event_schedule_get_by_name():
     schedule = fastf1.events.EventSchedule(
@@ -131,6 +141,68 @@ def test_event_schedule_get_by_name():
     assert schedule.get_event_by_name('test-test').EventName == 'test_test'
 
 
+def test_event_schedule_get_by_name_exact_and_partial():
+    schedule = fastf1.events.EventSchedule(
+        {
+            'EventName': ['Italian Grand Prix', 'Emilia Romagna Grand Prix',
+                          'British Grand Prix'],
+            'Location': ['Monza', 'Imola', 'Silverstone'],
+            'Country': ['Italy', 'Italy', 'Great Britain']
+        }
+    )
+
+    # exact match
+    assert schedule.get_event_by_name('monza').EventName \
+           == 'Italian Grand Prix'
+    # partial match
+    assert schedule.get_event_by_name('silver').EventName \
+           == 'British Grand Prix'
+    # exact match of multiple events, falls back to fuzzy matching
+    assert schedule.get_event_by_name('italy').EventName \
+           == 'Italian Grand Prix'
+
+
+def test_event_schedule_get_by_name_after_modification():
+    schedule = fastf1.events.EventSchedule(
+        {
+            'EventName': ['Italian Grand Prix', 'British Grand Prix'],
+            'Location': ['Monza', 'Silverstone']
+        }
+    )
+    assert schedule.get_event_by_name('monza').EventName \
+           == 'Italian Grand Prix'
+
+    # modifying the schedule in place needs to be respected
+    schedule.loc[1, 'Location'] = 'Monza'
+    schedule.loc[0, 'Location'] = 'Imola'
+    assert schedule.get_event_by_name('monza').EventName \
+           == 'British Grand Prix'
+
+    # partial match after modifying the schedule in place
+    schedule.loc[0, 'EventName'] = 'Emilia Romagna Grand Prix'
+    assert schedule.get_event_by_name('romagna').EventName \
+           == 'Emilia Romagna Grand Prix'
+    assert schedule.get_event_by_name('imol').EventName \
+           == 'Emilia Romagna Grand Prix'
+
+
+def test_event_name_deprecation():
+    schedule = fastf1.events.EventSchedule({'EventName': ['A', 'B']})
+    event = schedule.iloc[0]
+
+    # reading the deprecated property warns
+    with pytest.warns(FutureWarning, match="deprecated"):
+        assert event.name == 'A'
+
+    # renaming the event does not warn
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        renamed = event.rename('x')
+        event.name = 'y'
+    assert pd.Series.name.fget(renamed) == 'x'
+    assert pd.Series.name.fget(event) == 'y'
+
+
 def test_event_is_testing():
     assert fastf1.get_testing_event(2021, 1).is_testing()
     assert not fastf1.get_event(2021, 1).is_testing()
@@ -158,6 +230,31 @@ def test_event_get_session_name():
     assert event.get_session_name('Sprint Qualifying') == 'Sprint'
 
 
+def test_event_get_session_name_partial_data():
+    schedule = fastf1.events.EventSchedule(
+        {'Session1': ['Practice 1'], 'Session2': ['Qualifying'],
+         'Session3': ['Sprint'], 'Session4': ['Race']},
+        year=2022
+    )
+    event = schedule.iloc[0]
+    assert event.get_session_name('fp1') == 'Practice 1'
+    assert event.get_session_name('QUALIFYING') == 'Qualifying'
+    assert event.get_session_name('sq') == 'Sprint'
+    assert event.get_session_name(4) == 'Race'
+
+    with pytest.raises(ValueError, match="Invalid session type"):
+        event.get_session_name('FP4')
+    with pytest.raises(ValueError, match="No session of type"):
+        event.get_session_name('FP2')
+
+    # modifying the event in place needs to be respected
+    event['Session1'] = 'Practice 9'
+    with pytest.raises(ValueError, match="No session of type"):
+        event.get_session_name('FP1')
+    with pytest.raises(ValueError, match="No session of type"):
+        event.get_practice(1)
+
+
 def test_event_get_session_date():
     event = fastf1.get_event(2021, 1)
     sd = event.get_session_date('Q')
@@ -165,6 +262,25 @@ def test_event_get_session_date():
     assert isinstance(sd, pd.Timestamp)
 
 
+def test_event_get_session_date_partial_data():
+    schedule = fastf1.events.EventSchedule(
+        {'Session1': ['Practice 1'], 'Session1Date': ['2021-03-26 11:30'],
+         'Session2': ['Qualifying'], 'Session2Date': ['2021-03-27 15:00'],
+         'Session3': [''], 'Session3Date': [None]},
+        year=2021
+    )
+    event = schedule.iloc[0]
+    assert event.get_session_date('Q') == pd.Timestamp('2021-03-27 15:00')
+    assert event.get_session_date(1) == pd.Timestamp('2021-03-26 11:30')
+
+    with pytest.raises(ValueError):
+        event.get_session_date('R')
+
+    # modifying the event in place needs to be respected
+    event['Session2Date'] = pd.Timestamp('2021-03-27 16:00')
+    assert event.get_session_date('Q') == pd.Timestamp('2021-03-27 16:00')
+
+
 @pytest.mark.parametrize(
     "meth_name,args,expected_name",
     [
@@ -182,3 +298,65 @@ def test_event_get_session(meth_name, args, expected_name):
     event = fastf1.get_event(2021, 14)
     session = getattr(event, meth_name)(*args)
     assert session.name == expected_name
+
+
+def test_event_schedule_memory_cache(monkeypatch):
+    calls = list()
+
+    def _get_schedule(year):
+        calls.append('primary')
+        raise ConnectionError
+
+    def _get_schedule_from_ergast(year):
+        calls.append('ergast')
+        return fastf1.events.EventSchedule(
+            {'EventName': ['A'], 'EventFormat': ['conventional']}, year=year
+        )
+
+    monkeypatch.setattr(fastf1.events, '_get_schedule', _get_schedule)
+    monkeypatch.setattr(fastf1.events, '_get_schedule_from_ergast',
+                        _get_schedule_from_ergast)
+    fastf1.Cache._clear_memory_caches()
+
+    # schedules from the fallback backend are not cached
+    fastf1.get_event_schedule(2020)
+    fastf1.get_event_schedule(2020)
+    assert calls == ['primary', 'ergast'] * 2
+
+    # schedules from the ergast backend are cached if it is used explicitly
+    calls.clear()
+    fastf1.get_event_schedule(2020, force_ergast=True)
+    fastf1.get_event_schedule(2020, force_ergast=True)
+    assert calls == ['ergast']
+
+    # the cached schedules are cleared together with the api cache
+    calls.clear()
+    fastf1.Cache.set_disabled()
+    fastf1.Cache.set_enabled()
+    fastf1.get_event_schedule(2020, force_ergast=True)
+    assert calls == ['ergast']
+
+    # cached schedules expire
+    calls.clear()
+    monkeypatch.setattr(fastf1.events, '_SCHEDULE_CACHE_EXPIRY',
+                        datetime.timedelta(hours=-1))
+    fastf1.get_event_schedule(2020, force_ergast=True)
+    assert calls == ['ergast']
+
+    fastf1.Cache._clear_memory_caches()
+
+
+def test_event_schedule_load_cached(tmpdir):
+    cache_file_path = str(tmpdir.join('schedule_2020.ff1pkl'))
+    schedule = fastf1.events.EventSchedule({'EventName': ['A']}, year=2020,
+                                           force_default_cols=True)
+    fastf1.Cache._write_cache(schedule, cache_file_path,
+                              timestamp=datetime.datetime.now())
+    cached = fastf1.events._load_cached_schedule(cache_file_path)
+    pd.testing.assert_frame_equal(cached, schedule)
+
+    # schedules with an outdated set of columns are not used
+    schedule = schedule.drop(columns=['F1ApiSupport'])
+    fastf1.Cache._write_cache(schedule, cache_file_path,
+                              timestamp=datetime.datetime.now())
+    assert fastf1.events._load_cached_schedule(cache_file_path) is None
@@ -90,6 +90,12 @@ def test_laps_get_weather_data(reference_laps_data):
                 'TrackTemp', 'WindDirection', 'WindSpeed', 'Time'):
         assert col in wd.columns
 
+    # test that the weather data matches the weather data of single laps
+    for i in (0, 100, 500):
+        lap_wd = laps.iloc[i].get_weather_data()
+        assert wd.index[i] == lap_wd.name
+        assert wd['Time'].iloc[i] == lap_wd['Time']
+
     # test that an empty laps object returns empty weather data
     no_laps = fastf1.core.Laps()
     no_laps.session = session
@@ -124,6 +124,50 @@ def test_slice_by_mask(reference_laps_data):
     assert slice2['SessionTime'].iloc[0] == test_data['SessionTime'].iloc[198]
 
 
+def test_slice_by_mask_contiguous_and_not_contiguous():
+    tel = fastf1.core.Telemetry({'example': (1, 2, 3, 4, 5, 6)})
+
+    slice1 = tel.slice_by_mask(numpy.array([0, 1, 1, 1, 0, 0], dtype=bool))
+    assert isinstance(slice1, fastf1.core.Telemetry)
+    assert list(slice1['example']) == [2, 3, 4]
+    assert list(slice1.index) == [1, 2, 3]
+
+    slice2 = tel.slice_by_mask(numpy.array([1, 0, 1, 0, 0, 1], dtype=bool))
+    assert isinstance(slice2, fastf1.core.Telemetry)
+    assert list(slice2['example']) == [1, 3, 6]
+    assert list(slice2.index) == [0, 2, 5]
+
+    # nothing selected, padding is not possible
+    slice3 = tel.slice_by_mask(numpy.zeros(6, dtype=bool))
+    assert slice3.empty
+    with pytest.raises(ValueError):
+        tel.slice_by_mask(numpy.zeros(6, dtype=bool), pad=1)
+
+    # slices must not be views of the original data
+    slice1.loc[:, 'example'] = 0
+    assert list(tel['example']) == [1, 2, 3, 4, 5, 6]
+
+
+def test_slice_by_time_sorted_and_unsorted():
+    session_time = pandas.to_timedelta([1, 2, 3, 4, 5, 6], unit='s')
+    tel = fastf1.core.Telemetry({'SessionTime': session_time,
+                                 'example': (1, 2, 3, 4, 5, 6)})
+    start, end = pandas.Timedelta(2, 's'), pandas.Timedelta(4, 's')
+
+    slice1 = tel.slice_by_time(start, end)
+    assert list(slice1['example']) == [2, 3, 4]
+
+    slice2 = tel.slice_by_time(start, end, pad=1, pad_side='after')
+    assert list(slice2['example']) == [2, 3, 4, 5]
+
+    # unsorted time, samples are compared one by one
+    tel_unsorted = tel.iloc[[0, 3, 1, 4, 2, 5]]
+    slice3 = tel_unsorted.slice_by_time(start, end)
+    assert list(slice3['example']) == [4, 2, 3]
+
+    assert tel.slice_by_time(start, pandas.NaT).empty
+
+
 @pytest.mark.f1telapi
 def test_slice_by_lap(reference_laps_data):
     session, laps = reference_laps_data
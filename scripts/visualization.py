@@ -94,7 +94,7 @@ def plot_lap_position_integrity(laps_data, pos_data, suffix=''):
             continue
         if lap['LapStartDate'] not in pos_data[lap['DriverNumber']]['Date']:
             tmp_add = pd.DataFrame({}, index=[lap['LapStartDate'], ])
-            tmp_df = pos_data[lap['DriverNumber']].set_index('Date').append(tmp_add).sort_index()
+            tmp_df = pd.concat([pos_data[lap['DriverNumber']].set_index('Date'), tmp_add]).sort_index()
             tmp_df.loc[:, ('X', 'Y')] = tmp_df.loc[:, ('X', 'Y')].interpolate(method='quadratic')
 
             row = tmp_df[tmp_df.index == lap['LapStartDate']].iloc[0]